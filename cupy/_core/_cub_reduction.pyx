@@ -21,6 +21,12 @@ from cupy.cuda import driver
 from cupy import _util
 
 
+# Reduce types that CUB can load with vector instructions
+cdef set _vectorizable_types = {
+    'int', 'unsigned int', 'long long', 'unsigned long long',
+    'float', 'double'}
+
+
 cdef function.Function _create_cub_reduction_function(
         name, block_size, items_per_thread,
         reduce_type, params, arginfos, identity,
@@ -55,9 +61,13 @@ cdef function.Function _create_cub_reduction_function(
         options += ('-DCUPY_USE_JITIFY',)
         backend = 'nvrtc'
 
-    # TODO(leofang): try splitting the for-loop into full tiles and partial
-    # tiles to utilize LoadDirectBlockedVectorized? See, for example,
+    # Full tiles are loaded with LoadDirectBlockedVectorized, which needs a
+    # primitive type of at most 8 bytes; other types fall back to
+    # LoadDirectBlocked. See, for example,
     # https://github.com/NVlabs/cub/blob/c3cceac115c072fb63df1836ff46d8c60d9eb304/cub/agent/agent_reduce.cuh#L311-L346
+    cdef str load_algorithm = (
+        'cub::BLOCK_LOAD_VECTORIZE' if reduce_type in _vectorizable_types
+        else 'cub::BLOCK_LOAD_DIRECT')
 
     cdef str module_code = _get_cub_header_include()
     module_code += '''
@@ -76,6 +86,9 @@ static_assert(sizeof(_type_reduce) <= 32,
 // for hipCUB: use the hipcub namespace
 #ifdef __HIP_DEVICE_COMPILE__
 #define cub hipcub
+#define BLOCK_LOAD_ALGORITHM  cub::BLOCK_LOAD_DIRECT
+#else
+#define BLOCK_LOAD_ALGORITHM  ${load_algorithm}
 #endif
 
 #if defined FIRST_PASS
@@ -108,7 +121,7 @@ __global__ void ${name}(${params}) {
         module_code += '''
   // Specialize BlockLoad type for faster (?) loading
   typedef cub::BlockLoad<_type_reduce, BLOCK_SIZE,
-                         ITEMS_PER_THREAD, cub::BLOCK_LOAD_DIRECT> BlockLoadT;
+                         ITEMS_PER_THREAD, BLOCK_LOAD_ALGORITHM> BlockLoadT;
 
   // Shared memory for loading
   __shared__ typename BlockLoadT::TempStorage temp_storage_load;
@@ -166,9 +179,15 @@ __global__ void ${name}(${params}) {
 
     if pre_map_expr == 'in0':
         module_code += '''
-      // load a tile
-      BlockLoadT(temp_storage_load).Load(segment_head + i, _sdata, tile_size,
-                                         _type_reduce(${identity}));
+      // load a tile; vectorized loads need full tiles aligned to 4 items
+      if (tile_size == BLOCK_SIZE * ITEMS_PER_THREAD
+          && reinterpret_cast<size_t>(segment_head + i)
+             % (4 * sizeof(type_mid_in)) == 0) {
+          BlockLoadT(temp_storage_load).Load(segment_head + i, _sdata);
+      } else {
+          BlockLoadT(temp_storage_load).Load(
+              segment_head + i, _sdata, tile_size, _type_reduce(${identity}));
+      }
 '''
     else:  # pre_map_expr could be something like "in0 != type_in0_raw(0)"
         module_code += '''
@@ -213,6 +232,7 @@ __global__ void ${name}(${params}) {
         name=name,
         block_size=block_size,
         items_per_thread=items_per_thread,
+        load_algorithm=load_algorithm,
         reduce_type=reduce_type,
         params=_get_cub_kernel_params(params, arginfos),
         identity=identity,
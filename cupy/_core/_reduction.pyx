@@ -65,6 +65,15 @@ ${preamble}
   _sdata[_tid] = REDUCE(_a, _b); \
 }
 
+// From the step with _block < 32 on, the partials are read and written only
+// by the first warp, so these steps only need to be synchronized within it.
+#ifdef __HIP_DEVICE_COMPILE__
+#define _SYNC_STEP(_block) __syncthreads()
+#else
+#define _SYNC_STEP(_block) \
+  if (_block < 32) { __syncwarp(); } else { __syncthreads(); }
+#endif
+
 typedef ${reduce_type} _type_reduce;
 extern "C" __global__ void ${name}(${params}) {
   __shared__ char _sdata_raw[${block_size} * sizeof(_type_reduce)];
@@ -97,7 +106,7 @@ extern "C" __global__ void ${name}(${params}) {
       if (_tid < _block) {
         _REDUCE(_block);
       }
-      __syncthreads();
+      _SYNC_STEP(_block);
     }
     if (_tid < _block_stride) {
       _s = _sdata[_tid];
@@ -292,6 +301,7 @@ cdef class _AbstractReductionKernel:
             bint keepdims, bint reduce_dims, int device_id,
             stream, bint try_use_cub=False, bint sort_reduce_axis=True):
         cdef tuple reduce_axis, out_axis, axis_permutes
+        cdef tuple sorted_out_axis, out_permutes
         cdef tuple params, opt_params
         cdef tuple shape_and_strides
         cdef Py_ssize_t i
@@ -355,6 +365,28 @@ cdef class _AbstractReductionKernel:
                 if cub_success:
                     return ret
 
+        # Threads of a block take consecutive output elements. Iterate the
+        # output axes in the memory order of the input (as done above for a
+        # single output axis) so that those threads read neighboring input
+        # elements, by passing transposed views of the outputs to the kernel.
+        if (len(in_args) == 1
+                and len(out_axis) > 1
+                and not in_args[0]._c_contiguous
+                and not any([p.raw for p in self._params])):
+            sorted_out_axis = _sort_axis(out_axis, in_args[0].strides)
+            if sorted_out_axis != out_axis:
+                if keepdims:
+                    out_permutes = reduce_axis + sorted_out_axis
+                else:
+                    out_permutes = tuple(
+                        [out_axis.index(dim) for dim in sorted_out_axis])
+                out_args = [
+                    _manipulation._transpose(x, out_permutes)
+                    if isinstance(x, _ndarray_base) else x
+                    for x in out_args]
+                out_shape = (<_ndarray_base>out_args[0])._shape
+                out_axis = sorted_out_axis
+
         axis_permutes = reduce_axis + out_axis
         in_shape = _set_permuted_args(
             in_args, axis_permutes, a_shape, self.in_params)
@@ -99,9 +99,12 @@ cdef _ndarray_base _ndarray_prod(
         if result is not None:
             return result
     if dtype is None:
-        return _prod_auto_dtype(self, axis, dtype, out, keepdims)
+        reduction = _prod_auto_dtype
     else:
-        return _prod_keep_dtype(self, axis, dtype, out, keepdims)
+        reduction = _prod_keep_dtype
+    if _use_two_pass_reduction(self, axis, dtype, keepdims):
+        return _two_pass_reduction(reduction, self, dtype, out)
+    return reduction(self, axis, dtype, out, keepdims)
 
 
 cdef _ndarray_base _ndarray_sum(
@@ -120,9 +123,12 @@ cdef _ndarray_base _ndarray_sum(
             return result
 
     if dtype is None:
-        return _sum_auto_dtype(self, axis, dtype, out, keepdims)
+        reduction = _sum_auto_dtype
     else:
-        return _sum_keep_dtype(self, axis, dtype, out, keepdims)
+        reduction = _sum_keep_dtype
+    if _use_two_pass_reduction(self, axis, dtype, keepdims):
+        return _two_pass_reduction(reduction, self, dtype, out)
+    return reduction(self, axis, dtype, out, keepdims)
 
 
 cdef _ndarray_base _ndarray_cumsum(_ndarray_base self, axis, dtype, out):
@@ -152,6 +158,38 @@ cdef _ndarray_base _ndarray_clip(_ndarray_base self, a_min, a_max, out):
 
 # private/internal
 
+# The simple reduction kernel reduces the whole array within a single thread
+# block when no axis is left. Large arrays are instead reduced in two passes;
+# first into partial results, each computed by its own thread block, and then
+# the partial results.
+cdef Py_ssize_t _two_pass_min_size = 1 << 20
+cdef Py_ssize_t _two_pass_num_partials = 1024
+
+
+cdef bint _use_two_pass_reduction(
+        _ndarray_base a, axis, dtype, keepdims) except *:
+    if axis is not None or keepdims:
+        return False
+    if a.size < _two_pass_min_size or not a._c_contiguous:
+        return False
+    # CUB block reduction already runs two passes
+    if _accelerator.ACCELERATOR_CUB in _accelerator._reduction_accelerators:
+        return False
+    # Partial results in float16 would lose the float accumulation
+    return (a.dtype if dtype is None else get_dtype(dtype)).char != 'e'
+
+
+cdef _ndarray_base _two_pass_reduction(
+        reduction, _ndarray_base a, dtype, out):
+    cdef Py_ssize_t n = _two_pass_num_partials
+    cdef Py_ssize_t m = a.size // n
+    cdef _ndarray_base flat = a.ravel()
+    partials = reduction(flat[:n * m].reshape(n, m), 1, dtype, None, False)
+    if n * m != a.size:
+        rest = reduction(flat[n * m:], None, dtype, None, True)
+        partials = cupy.concatenate((partials, rest))
+    return reduction(partials, None, dtype, out, False)
+
 _op_char = {scan_op.SCAN_SUM: '+', scan_op.SCAN_PROD: '*'}
 _identity = {scan_op.SCAN_SUM: 0, scan_op.SCAN_PROD: 1}
 
@@ -710,6 +748,12 @@ cpdef scan_core(
         else:
             result = a.astype(out.dtype, order='C')
 
+    if axis is not None and a.ndim == 1:
+        # The scan along the only axis is the scan of the flattened array,
+        # which can be done by CUB.
+        internal._normalize_axis_index(axis, 1)
+        axis = None
+
     if axis is None:
         for accelerator in _accelerator._routine_accelerators:
             if accelerator == _accelerator.ACCELERATOR_CUB:
@@ -747,7 +791,10 @@ def _scan_for_test(a, out=None):
 
 
 cpdef _ndarray_base _nansum(_ndarray_base a, axis, dtype, out, keepdims):
-    if cupy.iscomplexobj(a):
+    if a.dtype.kind in 'biu':
+        # No NaN to skip; take the (possibly accelerated) path of sum.
+        return _ndarray_sum(a, axis, dtype, out, keepdims)
+    elif cupy.iscomplexobj(a):
         return _nansum_complex_dtype(a, axis, dtype, out, keepdims)
     elif dtype is None:
         return _nansum_auto_dtype(a, axis, dtype, out, keepdims)
@@ -756,7 +803,10 @@ cpdef _ndarray_base _nansum(_ndarray_base a, axis, dtype, out, keepdims):
 
 
 cpdef _ndarray_base _nanprod(_ndarray_base a, axis, dtype, out, keepdims):
-    if cupy.iscomplexobj(a):
+    if a.dtype.kind in 'biu':
+        # No NaN to skip; take the (possibly accelerated) path of prod.
+        return _ndarray_prod(a, axis, dtype, out, keepdims)
+    elif cupy.iscomplexobj(a):
         return _nanprod_complex_dtype(a, axis, dtype, out, keepdims)
     elif dtype is None:
         return _nanprod_auto_dtype(a, axis, dtype, out, keepdims)
@@ -1,3 +1,6 @@
+import operator
+import string
+
 import numpy
 
 import cupy
@@ -246,6 +249,8 @@ def diff(a, n=1, axis=-1, prepend=None, append=None):
     .. seealso:: :func:`numpy.diff`
     """
 
+    # n is spliced into the fused kernel source, so it must be an integer
+    n = operator.index(n)
     if n == 0:
         return a
     if n < 0:
@@ -276,6 +281,10 @@ def diff(a, n=1, axis=-1, prepend=None, append=None):
             append = cupy.broadcast_to(append, tuple(shape))
         combined.append(append)
 
+    # The first difference of a alone is already a single subtraction
+    if (n > 1 or len(combined) > 1) and n <= _diff_max_fused_order:
+        return _diff_fused(combined, n, axis)
+
     if len(combined) > 1:
         a = cupy.concatenate(combined, axis)
 
@@ -293,6 +302,73 @@ def diff(a, n=1, axis=-1, prepend=None, append=None):
     return a
 
 
+# The highest order of difference computed by a single kernel; every output
+# element keeps n + 1 input elements in registers and takes them n times.
+_diff_max_fused_order = 16
+
+
+@cupy._util.memoize(for_each_device=True)
+def _get_diff_kernel(n, is_bool):
+    # Computes the n-th difference of the concatenation of x0, x1 and x2 along
+    # the middle axis, without materializing the concatenation. The inputs are
+    # differenced in the same order as by repeated subtractions.
+    code = string.Template('''
+        const ptrdiff_t r = i % inner;
+        const ptrdiff_t k = i / inner % len_y;
+        const ptrdiff_t o = i / inner / len_y;
+        T x[${n} + 1];
+        for (int j = 0; j <= ${n}; ++j) {
+            ptrdiff_t c = k + j;
+            if (c < len0) {
+                x[j] = x0[(o * len0 + c) * inner + r];
+            } else if ((c -= len0) < len1) {
+                x[j] = x1[(o * len1 + c) * inner + r];
+            } else {
+                c -= len1;
+                x[j] = x2[(o * len2 + c) * inner + r];
+            }
+        }
+        for (int m = ${n}; m > 0; --m) {
+            for (int j = 0; j < m; ++j) {
+                x[j] = x[j + 1] ${op} x[j];
+            }
+        }
+        y = x[0];
+    ''').substitute(n=n, op='!=' if is_bool else '-')
+    return cupy.ElementwiseKernel(
+        'raw T x0, raw T x1, raw T x2, '
+        'int64 len0, int64 len1, int64 len2, int64 len_y, int64 inner',
+        'T y', code, 'cupy_diff')
+
+
+def _diff_fused(arrays, n, axis):
+    shape = list(arrays[0].shape)
+    for x in arrays[1:]:
+        if x.ndim != len(shape):
+            raise ValueError(
+                'All arrays to concatenate must have the same ndim')
+        for i in range(len(shape)):
+            if i != axis and x.shape[i] != shape[i]:
+                raise ValueError(
+                    'All arrays must have same shape except the axis to '
+                    'concatenate')
+    dtype = numpy.result_type(*[x.dtype for x in arrays])
+    outer = internal.prod(shape[:axis])
+    inner = internal.prod(shape[axis + 1:])
+    lengths = [x.shape[axis] for x in arrays]
+    arrays = [
+        x.astype(dtype, copy=False).reshape(outer, length, inner)
+        for x, length in zip(arrays, lengths)]
+    arrays += arrays[:1] * (3 - len(arrays))
+    lengths += [0] * (3 - len(lengths))
+
+    shape[axis] = max(sum(lengths) - n, 0)
+    y = cupy.empty(shape, dtype)
+    kernel = _get_diff_kernel(n, dtype == numpy.bool_)
+    kernel(*arrays, *lengths, shape[axis], inner, y)
+    return y
+
+
 def gradient(f, *varargs, axis=None, edge_order=1):
     """Return the gradient of an N-dimensional array.
 
@@ -9,6 +9,7 @@ from cupy_backends.cuda.api cimport runtime
 from cupy._core.core cimport _internal_ascontiguousarray
 from cupy._core.core cimport _internal_asfortranarray
 from cupy._core.internal cimport _contig_axes
+from cupy._core._memory_range cimport may_share_bounds
 from cupy.cuda cimport common
 from cupy.cuda cimport device
 from cupy.cuda cimport memory
@@ -112,6 +113,21 @@ cdef tuple _get_output_shape(_ndarray_base arr, tuple out_axis, bint keepdims):
     return out_shape
 
 
+cdef bint _can_write_to_out(
+        _ndarray_base x, out, tuple out_shape, str order) except? -1:
+    # Whether the result can be written directly into out, skipping the
+    # allocation of a temporary result and its copy to out
+    cdef _ndarray_base y
+    if out is None:
+        return False
+    y = out
+    if y.dtype != x.dtype or y.shape != out_shape:
+        return False
+    if not (y._c_contiguous if order == 'C' else y._f_contiguous):
+        return False
+    return not may_share_bounds(x, y)
+
+
 cpdef Py_ssize_t _preprocess_array(tuple arr_shape, tuple reduce_axis,
                                    tuple out_axis, str order) except -1:
     '''
@@ -144,11 +160,13 @@ def device_reduce(_ndarray_base x, op, tuple out_axis, out=None,
     cdef void *ws_ptr
     cdef Stream_t s
     cdef tuple out_shape
+    cdef bint to_out = False
 
     if keepdims:
         out_shape = _get_output_shape(x, out_axis, keepdims)
         ndim_out = len(out_shape)
     else:
+        out_shape = ()
         ndim_out = 0
 
     if out is not None and out.ndim != ndim_out:
@@ -166,7 +184,8 @@ def device_reduce(_ndarray_base x, op, tuple out_axis, out=None,
     x = _internal_ascontiguousarray(x)
 
     if op in (CUPY_CUB_SUM, CUPY_CUB_PROD, CUPY_CUB_MIN, CUPY_CUB_MAX):
-        y = _core.ndarray((), x.dtype)
+        to_out = _can_write_to_out(x, out, out_shape, 'C')
+        y = out if to_out else _core.ndarray((), x.dtype)
     else:  # argmin and argmax
         # cub::KeyValuePair has 1 int + 1 arbitrary type
         kv_bytes = (4 + x.dtype.itemsize)
@@ -190,6 +209,8 @@ def device_reduce(_ndarray_base x, op, tuple out_axis, out=None,
         y = y[0:4].view(numpy.int32).astype(numpy.int64)[0]
         y = y.reshape(())
 
+    if to_out:
+        return y
     if keepdims:
         y = y.reshape(out_shape)
     if out is not None:
@@ -212,6 +233,7 @@ def device_segmented_reduce(_ndarray_base x, op, tuple reduce_axis,
     cdef size_t ws_size
     cdef tuple out_shape
     cdef Stream_t s
+    cdef bint to_out
 
     if op not in (CUPY_CUB_SUM, CUPY_CUB_PROD, CUPY_CUB_MIN, CUPY_CUB_MAX):
         raise ValueError('only CUPY_CUB_SUM, CUPY_CUB_PROD, CUPY_CUB_MIN, '
@@ -229,11 +251,15 @@ def device_segmented_reduce(_ndarray_base x, op, tuple reduce_axis,
     # prepare input
     out_shape = _get_output_shape(x, out_axis, keepdims)
     x_ptr = <void*>x.data.ptr
-    y = _core.ndarray(out_shape, dtype=x.dtype, order=order)
-    y_ptr = <void*>y.data.ptr
     if out is not None and out.shape != out_shape:
         raise ValueError(
             'output parameter for reduction operation has the wrong shape')
+    to_out = _can_write_to_out(x, out, out_shape, order)
+    if to_out:
+        y = out
+    else:
+        y = _core.ndarray(out_shape, dtype=x.dtype, order=order)
+    y_ptr = <void*>y.data.ptr
     if x.size == 0:  # for CUPY_CUB_SUM & CUPY_CUB_PROD
         if out is not None:
             y = out
@@ -256,7 +282,7 @@ def device_segmented_reduce(_ndarray_base x, op, tuple reduce_axis,
         cub_device_segmented_reduce(ws_ptr, ws_size, x_ptr, y_ptr, n_segments,
                                     contiguous_size, s, op_code, dtype_id)
 
-    if out is not None:
+    if out is not None and not to_out:
         cupy._core.elementwise_copy(y, out)
         y = out
     return y
@@ -482,6 +508,50 @@ cdef _cub_reduce_dtype_compatible(x_dtype, int op, dtype=None):
     return True
 
 
+cdef tuple _sort_axis_by_strides(tuple strides):
+    # Axes in the decreasing order of strides
+    return tuple(sorted(range(len(strides)), key=lambda i: -strides[i]))
+
+
+cdef _squeezed_reduction(
+        _ndarray_base arr, op, tuple reduce_axis, tuple out_axis, dtype,
+        _ndarray_base out, bint keepdims):
+    # Dimensions of size 1 do not contribute to the reduction but may keep
+    # the reduced axes from being contiguous (or all axes from being
+    # reduced), so drop them before choosing between device_reduce and
+    # device_segmented_reduce.
+    cdef tuple out_shape, shape, axis
+    cdef _ndarray_base x, y, out_view = None
+    cdef list new_axis = []
+    cdef Py_ssize_t i, n = 0
+
+    out_shape = _get_output_shape(arr, out_axis, keepdims)
+    if out is not None and out.shape != out_shape:
+        # let the unsqueezed path report the error
+        return None
+    for i in range(arr.ndim):
+        if arr._shape[i] == 1:
+            continue
+        if i in reduce_axis:
+            new_axis.append(n)
+        n += 1
+    if not new_axis:
+        return None
+    axis = tuple(new_axis)
+    shape = tuple([s for s in arr.shape if s != 1])
+    x = arr.reshape(shape)
+    if out is not None and (out._c_contiguous or out._f_contiguous):
+        out_view = out.reshape(tuple([s for s in out_shape if s != 1]))
+    y = cub_reduction(x, op, axis, dtype, out_view, False)
+    if y is None:
+        return None
+    if out is None:
+        return y.reshape(out_shape)
+    if out_view is None:
+        cupy._core.elementwise_copy(y.reshape(out_shape), out)
+    return out
+
+
 cpdef cub_reduction(
         _ndarray_base arr, op,
         axis=None, dtype=None, _ndarray_base out=None, keepdims=False):
@@ -522,14 +592,28 @@ cpdef cub_reduction(
                 # fallback to existing non-CUB behavior
                 return None
 
+    reduce_axis, out_axis = _get_axis(axis, arr.ndim)
     if arr._c_contiguous:
         order = 'C'
     elif arr._f_contiguous:
         order = 'F'
+    elif out_axis == () and op not in (CUPY_CUB_ARGMIN, CUPY_CUB_ARGMAX):
+        # The order of elements does not matter for a full reduction, so a
+        # transposed view of dense memory can be reduced without a copy.
+        arr = arr.transpose(_sort_axis_by_strides(arr.strides))
+        if not arr._c_contiguous:
+            return None
+        order = 'C'
     else:
         return None
 
-    reduce_axis, out_axis = _get_axis(axis, arr.ndim)
+    if (op not in (CUPY_CUB_ARGMIN, CUPY_CUB_ARGMAX) and arr.size > 1
+            and 1 in arr.shape):
+        y = _squeezed_reduction(
+            arr, op, reduce_axis, out_axis, dtype, out, keepdims)
+        if y is not None:
+            return y
+
     if can_use_device_reduce(arr, op, out_axis, dtype):
         return device_reduce(arr, op, out_axis, out, keepdims)
 
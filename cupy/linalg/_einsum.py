@@ -1,4 +1,5 @@
-import copy
+import collections
+import functools
 import itertools
 import operator
 import string
@@ -18,6 +19,11 @@ try:
 except ImportError:
     cutensor = None
 
+try:
+    import opt_einsum
+except ImportError:
+    opt_einsum = None
+
 
 options = {
     'sum_ellipsis': False,
@@ -26,6 +32,7 @@ options = {
 
 
 einsum_symbols = string.ascii_uppercase + string.ascii_lowercase
+einsum_symbols_set = frozenset(einsum_symbols)
 
 
 def _transpose_ex(a, axeses):
@@ -115,7 +122,7 @@ def _parse_einsum_input(args):
         for s in subscripts:
             if s in '.,-> ':
                 continue
-            if s not in einsum_symbols:
+            if s not in einsum_symbols_set:
                 raise ValueError(
                     'invalid subscript \'%s\' in einstein sum subscripts '
                     'string, subscripts must be letters' % s)
@@ -222,16 +229,16 @@ def _parse_ellipsis_subscript(subscript, idx, ndim=None, ellipsis_len=None):
             ('in the output' if idx is None else 'for operand %d' % idx))
 
 
-def _einsum_diagonals(input_subscripts, operands):
+def _einsum_diagonals(input_subscripts, operands, squeeze=False):
     """Compute diagonal for each operand
 
+    If ``squeeze`` is ``True``, axes of length 1 are also removed within the
+    same view, instead of a separate squeeze on top of the diagonal view.
+
     This function mutates args.
     """
-    for idx in range(len(input_subscripts)):
-        sub = input_subscripts[idx]
-        arr = operands[idx]
-
-        if len(set(sub)) < len(sub):
+    for idx, (sub, arr) in enumerate(zip(input_subscripts, operands)):
+        if len(set(sub)) < len(sub) or (squeeze and 1 in arr.shape):
             axeses = {}
             for axis, label in enumerate(sub):
                 axeses.setdefault(label, []).append(axis)
@@ -251,7 +258,16 @@ def _einsum_diagonals(input_subscripts, operands):
                         % (idx, _chr(label), dim0, dim1)
                     )
 
-            sub, axeses = zip(*axeses)  # axeses is not empty
+            if squeeze:
+                axeses = [
+                    (label, axes)
+                    for label, axes in axeses
+                    if arr.shape[axes[0]] != 1
+                ]
+            if axeses:
+                sub, axeses = zip(*axeses)
+            else:
+                sub = ()
             input_subscripts[idx] = list(sub)
             operands[idx] = _transpose_ex(arr, axeses)
 
@@ -277,12 +293,80 @@ def _iter_path_pairs(path):
                 yield -1, idx
 
 
-def _flatten_transpose(a, axeses):
+def _connected_path(input_subscripts):
+    """Contraction path used when no optimization is requested
+
+    Operands are accumulated from the last one, each time with the last
+    remaining operand that shares a label with the intermediate result, so
+    that an outer product is formed only if the operands are disconnected.
+
+    Args:
+        input_subscripts (list of lists of ints)
+
+    Returns:
+        list of tuples of ints: path in the format of numpy.einsum_path
+    """
+    subs = [set(sub) for sub in input_subscripts]
+    acc = subs.pop()
+    path = []
+    while subs:
+        for idx in range(len(subs) - 1, -1, -1):
+            if not acc.isdisjoint(subs[idx]):
+                break
+        else:
+            idx = len(subs) - 1
+        acc |= subs.pop(idx)
+        path.append((idx, len(subs) + 1))
+    return path
+
+
+_mul_sum_kernel = cupy._core.ReductionKernel(
+    'T x, T y',
+    'T z',
+    'x * y',
+    'a + b',
+    'z = a',
+    '0',
+    'einsum_mul_sum'
+)
+
+
+_path_algorithms = {
+    'greedy': _greedy_path,
+    'optimal': _optimal_path,
+}
+
+
+def _get_path_algorithm(name):
+    try:
+        return _path_algorithms[name]
+    except KeyError:
+        if opt_einsum is None:
+            raise
+    # Other path finders (e.g., 'dp', 'branch-2', 'auto') are provided by
+    # opt_einsum if available.
+    return opt_einsum.paths.get_path_fn(name)
+
+
+@functools.lru_cache(maxsize=512)
+def _compute_path(algo, memory_limit, input_subscripts, output_subscript,
+                  dimensions):
+    # Cached as the subscripts and shapes are usually fixed across calls
+    # (e.g., every iteration of a training loop) and path finding is costly.
+    input_sets = [set(sub) for sub in input_subscripts]
+    output_set = set(output_subscript)
+    return tuple(
+        algo(input_sets, output_set, dict(dimensions), memory_limit))
+
+
+def _flatten_transpose(a, axeses, dtype=None):
     """Transpose and flatten each
 
     Args:
         a
         axeses (sequence of sequences of ints)
+        dtype: If given and different from the dtype of ``a``, ``a`` is
+            casted to it within the copy made for the transpose.
 
     Returns:
         aT: a with its axes permutated and flatten
@@ -294,8 +378,13 @@ def _flatten_transpose(a, axeses):
     for axes in axeses:
         transpose_axes.extend(axes)
         shapes.append([a.shape[axis] for axis in axes])
+    if transpose_axes != list(range(a.ndim)):
+        a = a.transpose(transpose_axes)
+    if dtype is not None and a.dtype != dtype:
+        # C-ordered so that the reshape below never copies again
+        a = a.astype(dtype, order='C')
     return (
-        a.transpose(transpose_axes).reshape(
+        a.reshape(
             tuple([cupy._core.internal.prod(shape) for shape in shapes])),
         shapes
     )
@@ -312,6 +401,41 @@ def _use_cutensor(dtype0, sub0, dtype1, sub1, batch_dims, contract_dims):
     return True
 
 
+def _use_cutensor_reduction(arr, dtype):
+    if cutensor is None:
+        return False
+    if (_accelerator.ACCELERATOR_CUTENSOR not in
+            _accelerator.get_routine_accelerators()):
+        return False
+    if not cutensor.check_availability('reduction'):
+        return False
+    if arr.dtype != dtype:
+        return False
+    if arr.dtype not in (cupy.float32, cupy.float64,
+                         cupy.complex64, cupy.complex128):
+        return False
+    # cuTENSOR requires contiguous operands (i.e., not diagonal views). Also
+    # skip trivial sizes as cupy.cutensor does.
+    return arr.flags.c_contiguous and arr.size > 1
+
+
+_cutensor_modes = {}
+
+
+def _create_cutensor_mode(sub):
+    # Reuse the same Mode object for the same subscript so that the
+    # contraction descriptors and plans cached in cupy.cutensor (keyed by
+    # the address of the mode buffer) are hit on repeated calls. Modes are
+    # never evicted, as cupy.cutensor does for its own modes: a freed buffer
+    # may be reused by a Mode with other labels and hit a stale descriptor.
+    key = tuple(sub)
+    mode = _cutensor_modes.get(key)
+    if mode is None:
+        mode = cutensor.create_mode(*key)
+        _cutensor_modes[key] = mode
+    return mode
+
+
 def _get_out_shape(shape0, sub0, shape1, sub1, sub_out):
     extent = {}
     for size, i in zip(shape0 + shape1, sub0 + sub1):
@@ -356,22 +480,39 @@ def _expand_dims_transpose(arr, mode, mode_out):
     return cupy.transpose(arr.reshape(shape), axes)
 
 
-def reduced_binary_einsum(arr0, sub0, arr1, sub1, sub_others):
+def _multiply(arr0, arr1, dtype):
+    if dtype is None:
+        return arr0 * arr1
+    # Cast inside the element-wise kernel instead of materializing the
+    # casted operands
+    return cupy.multiply(arr0, arr1, dtype=dtype, casting='unsafe')
+
+
+def reduced_binary_einsum(arr0, sub0, arr1, sub1, sub_others, dtype=None):
     set0 = set(sub0)
     set1 = set(sub1)
     assert len(set0) == len(sub0), 'operand 0 should be reduced: diagonal'
     assert len(set1) == len(sub1), 'operand 1 should be reduced: diagonal'
 
     if len(sub0) == 0 or len(sub1) == 0:
-        return arr0 * arr1, sub0 + sub1
+        return _multiply(arr0, arr1, dtype), sub0 + sub1
 
     set_others = set(sub_others)
     shared = set0 & set1
     batch_dims = shared & set_others
     contract_dims = shared - batch_dims
 
-    bs0, cs0, ts0 = _make_transpose_axes(sub0, batch_dims, contract_dims)
-    bs1, cs1, ts1 = _make_transpose_axes(sub1, batch_dims, contract_dims)
+    # Order the shared dimensions as laid out in the larger operand, and the
+    # other dimensions as laid out in each operand, so that the transposes
+    # for GEMM below need no copy (or a copy of the smaller operand) when
+    # the operands come in a different axis order than their subscripts.
+    rank0 = _memory_rank(arr0, sub0)
+    rank1 = _memory_rank(arr1, sub1)
+    rank_shared = rank0 if arr0.size >= arr1.size else rank1
+    bs0, cs0, ts0 = _make_transpose_axes(
+        sub0, batch_dims, contract_dims, rank_shared, rank0)
+    bs1, cs1, ts1 = _make_transpose_axes(
+        sub1, batch_dims, contract_dims, rank_shared, rank1)
 
     sub_b = [sub0[axis] for axis in bs0]
     assert sub_b == [sub1[axis] for axis in bs1]
@@ -388,51 +529,82 @@ def reduced_binary_einsum(arr0, sub0, arr1, sub1, sub_others):
             sub_out = sub_others
         arr0 = _expand_dims_transpose(arr0, sub0, sub_out)
         arr1 = _expand_dims_transpose(arr1, sub1, sub_out)
-        return arr0 * arr1, sub_out
+        return _multiply(arr0, arr1, dtype), sub_out
 
+    if dtype is None:
+        dtype = cupy.result_type(arr0.dtype, arr1.dtype)
+    else:
+        dtype = cupy.dtype(dtype)
+
+    # GEMM requires both operands to be of the compute dtype. The casts below
+    # are done together with the copies to the layouts required by cuTENSOR
+    # or GEMM so that each operand is copied at most once.
     for accelerator in _accelerator.get_routine_accelerators():
         if (accelerator == _accelerator.ACCELERATOR_CUTENSOR and
                 cutensor is not None):
-            if _use_cutensor(arr0.dtype, sub0, arr1.dtype, sub1,
+            if _use_cutensor(dtype, sub0, dtype, sub1,
                              batch_dims, contract_dims):
                 if len(sub_out) == len(sub_others):
                     # to assure final output of einsum is C-contiguous
                     sub_out = sub_others
                 out_shape = _get_out_shape(
                     arr0.shape, sub0, arr1.shape, sub1, sub_out)
-                arr_out = cupy.empty(out_shape, arr0.dtype)
-                arr0 = cupy.ascontiguousarray(arr0)
-                arr1 = cupy.ascontiguousarray(arr1)
+                arr_out = cupy.empty(out_shape, dtype)
+                arr0 = cupy.ascontiguousarray(arr0, dtype)
+                arr1 = cupy.ascontiguousarray(arr1, dtype)
                 desc_0 = cutensor.create_tensor_descriptor(arr0)
                 desc_1 = cutensor.create_tensor_descriptor(arr1)
                 desc_out = cutensor.create_tensor_descriptor(arr_out)
                 arr_out = cutensor.contraction(
                     1.0,
-                    arr0, desc_0, sub0,
-                    arr1, desc_1, sub1,
+                    arr0, desc_0, _create_cutensor_mode(sub0),
+                    arr1, desc_1, _create_cutensor_mode(sub1),
                     0.0,
-                    arr_out, desc_out, sub_out)
+                    arr_out, desc_out, _create_cutensor_mode(sub_out))
                 return arr_out, sub_out
 
-    tmp0, shapes0 = _flatten_transpose(arr0, [bs0, ts0, cs0])
-    tmp1, shapes1 = _flatten_transpose(arr1, [bs1, cs1, ts1])
+    if not ts0 and not ts1 and dtype.char not in '?e':
+        # No free dimensions (e.g., 'Nc,Nc->N'): a batched dot product is
+        # done by one reduction kernel rather than GEMMs of 1x1 matrices.
+        tmp0 = arr0.transpose(bs0 + cs0).astype(dtype, copy=False)
+        tmp1 = arr1.transpose(bs1 + cs1).astype(dtype, copy=False)
+        arr_out = _mul_sum_kernel(
+            tmp0, tmp1, axis=tuple(range(len(bs0), tmp0.ndim)))
+        return arr_out, sub_b
+
+    if len(batch_dims) == 0:
+        # Use 2-D GEMM instead of batched GEMM with a batch size of 1
+        tmp0, shapes0 = _flatten_transpose(arr0, [ts0, cs0], dtype)
+        tmp1, shapes1 = _flatten_transpose(arr1, [cs1, ts1], dtype)
+        shapes_out = shapes0[0] + shapes1[1]
+        arr_out = cupy.matmul(tmp0, tmp1).reshape(shapes_out)
+        return arr_out, sub_out
+
+    tmp0, shapes0 = _flatten_transpose(arr0, [bs0, ts0, cs0], dtype)
+    tmp1, shapes1 = _flatten_transpose(arr1, [bs1, cs1, ts1], dtype)
     shapes_out = shapes0[0] + shapes0[1] + shapes1[2]
     assert shapes0[0] == shapes1[0]
     arr_out = cupy.matmul(tmp0, tmp1).reshape(shapes_out)
     return arr_out, sub_out
 
 
-def _make_transpose_axes(sub, b_dims, c_dims):
+def _memory_rank(a, sub):
+    # label -> position of its axis when ordered from the largest stride
+    axes = sorted(range(a.ndim), key=lambda axis: -abs(a.strides[axis]))
+    return {sub[axis]: i for i, axis in enumerate(axes)}
+
+
+def _make_transpose_axes(sub, b_dims, c_dims, rank_shared, rank):
     bs = []
     cs = []
     ts = []
     for axis, label in enumerate(sub):
         if label in b_dims:
-            bs.append((label, axis))
+            bs.append((rank_shared[label], axis))
         elif label in c_dims:
-            cs.append((label, axis))
+            cs.append((rank_shared[label], axis))
         else:
-            ts.append((label, axis))
+            ts.append((rank[label], axis))
     return (
         _tuple_sorted_by_0(bs),
         _tuple_sorted_by_0(cs),
@@ -444,6 +616,71 @@ def _tuple_sorted_by_0(zs):
     return tuple(i for _, i in sorted(zs))
 
 
+def _result_type(operands):
+    # Skip NumPy's type promotion in the common case where all operands are
+    # CuPy arrays of the same dtype.
+    dtype = None
+    for a in operands:
+        if not isinstance(a, cupy.ndarray):
+            return cupy.result_type(*operands)
+        if dtype is None:
+            dtype = a.dtype
+        elif a.dtype != dtype:
+            return cupy.result_type(*operands)
+    return dtype
+
+
+def _try_binary_einsum(input_subscripts, output_subscript, operands):
+    """Computes a simple binary einsum skipping the generic preprocessing.
+
+    Returns ``None`` unless the operands are two CuPy arrays of the same
+    dtype, and the subscripts have no ellipsis, no diagonals, no labels to be
+    summed within one operand and no broadcasting.
+    """
+    if len(operands) != 2:
+        return None
+    arr0, arr1 = operands
+    if not (isinstance(arr0, cupy.ndarray) and isinstance(arr1, cupy.ndarray)):
+        return None
+    if arr0.dtype != arr1.dtype or arr0.size == 0 or arr1.size == 0:
+        return None
+    sub0, sub1 = input_subscripts
+    if len(sub0) != arr0.ndim or len(sub1) != arr1.ndim:
+        return None
+    set0 = set(sub0)
+    set1 = set(sub1)
+    if len(set0) != len(sub0) or len(set1) != len(sub1):
+        return None
+    if '@' in set0 or '@' in set1:
+        return None
+    if output_subscript is None:
+        output_subscript = ''.join(sorted(set0 ^ set1))
+    elif '@' in output_subscript:
+        return None
+    set_out = set(output_subscript)
+    if (len(set_out) != len(output_subscript) or
+            not set_out <= set0 | set1 or
+            not set0 <= set1 | set_out or
+            not set1 <= set0 | set_out):
+        return None
+    for label, dim in zip(sub0, arr0.shape):
+        axis = sub1.find(label)
+        if axis >= 0 and arr1.shape[axis] != dim:
+            return None
+
+    # Same relabeling as in einsum
+    modes = {label: i for i, label in enumerate(dict.fromkeys(sub0 + sub1))}
+    sub_out = [modes[label] for label in output_subscript]
+    arr_out, sub = reduced_binary_einsum(
+        arr0, [modes[label] for label in sub0],
+        arr1, [modes[label] for label in sub1],
+        sub_out)
+    transpose_axes = [sub.index(label) for label in sub_out]
+    if transpose_axes != list(range(arr_out.ndim)):
+        arr_out = arr_out.transpose(transpose_axes)
+    return arr_out
+
+
 def einsum(*operands, **kwargs):
     """einsum(subscripts, *operands, dtype=None, optimize=False)
 
@@ -476,12 +713,16 @@ def einsum(*operands, **kwargs):
         dtype: If provided, forces the calculation to use the data type
             specified. Default is None.
         optimize: Valid options include {`False`, `True`, 'greedy', 'optimal'}.
-            Controls if intermediate optimization should occur. No optimization
-            will occur if `False`, and `True` will default to the 'greedy'
+            Controls if intermediate optimization should occur. If `False`,
+            no path search occurs and the operands are contracted pairwise
+            from the last one, preferring an operand that shares a subscript
+            with the intermediate result. `True` will default to the 'greedy'
             algorithm. Also accepts an explicit contraction list from
             :func:`numpy.einsum_path`. Defaults to `False`. If a pair is
             supplied, the second argument is assumed to be the maximum
-            intermediate size created.
+            intermediate size created. If `opt_einsum`_ is installed, the
+            other path finders of :func:`opt_einsum.contract_path` such as
+            'dp' are also accepted.
 
     Returns:
         cupy.ndarray:
@@ -489,6 +730,7 @@ def einsum(*operands, **kwargs):
 
     .. seealso:: :func:`numpy.einsum`
     .. _cuQuantum Python: https://docs.nvidia.com/cuda/cuquantum/python/
+    .. _opt_einsum: https://github.com/dgasmith/opt_einsum
     """
     out = _try_use_cutensornet(*operands, **kwargs)
     if out is not None:
@@ -511,7 +753,14 @@ def einsum(*operands, **kwargs):
         raise TypeError('Did not understand the following kwargs: %s'
                         % list(kwargs.keys))
 
-    result_dtype = cupy.result_type(*operands) if dtype is None else dtype
+    if dtype is None and (optimize is False or
+                          optimize in ('greedy', 'optimal')):
+        # Fast path for a plain binary contraction such as 'ij,jk->ik'
+        out = _try_binary_einsum(input_subscripts, output_subscript, operands)
+        if out is not None:
+            return out
+
+    result_dtype = _result_type(operands) if dtype is None else dtype
     operands = [
         cupy.asanyarray(arr)
         for arr in operands
@@ -524,10 +773,9 @@ def einsum(*operands, **kwargs):
 
     # Get length of each unique dimension and ensure all dimensions are correct
     dimension_dict = {}
-    for idx, sub in enumerate(input_subscripts):
-        sh = operands[idx].shape
+    for idx, (sub, arr) in enumerate(zip(input_subscripts, operands)):
         for axis, label in enumerate(sub):
-            dim = sh[axis]
+            dim = arr.shape[axis]
             if label in dimension_dict.keys():
                 # For broadcasting cases we always want the largest dim size
                 if dimension_dict[label] == 1:
@@ -543,11 +791,12 @@ def einsum(*operands, **kwargs):
 
     if output_subscript is None:
         # Build output subscripts
-        tmp_subscripts = list(itertools.chain.from_iterable(input_subscripts))
+        label_counts = collections.Counter(
+            itertools.chain.from_iterable(input_subscripts))
         output_subscript = [
             label
-            for label in sorted(set(tmp_subscripts))
-            if label < 0 or tmp_subscripts.count(label) == 1
+            for label in sorted(label_counts)
+            if label < 0 or label_counts[label] == 1
         ]
     else:
         if not options['sum_ellipsis']:
@@ -575,7 +824,10 @@ def einsum(*operands, **kwargs):
                         'einstein sum subscripts string includes output '
                         'subscript \'%s\' multiple times' % _chr(label))
 
-    _einsum_diagonals(input_subscripts, operands)
+    # Don't squeeze if unary, because this affects later (in trivial sum)
+    # whether the return is a writeable view.
+    _einsum_diagonals(
+        input_subscripts, operands, squeeze=len(operands) >= 2)
 
     # no more raises
 
@@ -586,84 +838,110 @@ def einsum(*operands, **kwargs):
                 dtype=result_dtype
             )
 
-        # Don't squeeze if unary, because this affects later (in trivial sum)
-        # whether the return is a writeable view.
-        for idx in range(len(operands)):
-            arr = operands[idx]
-            if 1 in arr.shape:
-                squeeze_indices = []
-                sub = []
-                for axis, label in enumerate(input_subscripts[idx]):
-                    if arr.shape[axis] == 1:
-                        squeeze_indices.append(axis)
-                    else:
-                        sub.append(label)
-                input_subscripts[idx] = sub
-                operands[idx] = cupy.squeeze(arr, axis=tuple(squeeze_indices))
-                assert operands[idx].ndim == len(input_subscripts[idx])
-            del arr
+    # Relabel to consecutive modes in order of appearance so that the cached
+    # paths and cuTENSOR modes are shared among calls which differ only in the
+    # letters used in the subscripts.
+    modes = {}
+    for label in itertools.chain(
+            itertools.chain.from_iterable(input_subscripts),
+            output_subscript, dimension_dict):
+        modes.setdefault(label, len(modes))
+    input_subscripts = [
+        [modes[label] for label in sub] for sub in input_subscripts]
+    output_subscript = [modes[label] for label in output_subscript]
+    dimension_dict = {
+        modes[label]: dim for label, dim in dimension_dict.items()}
 
     # unary einsum without summation should return a (writeable) view
     returns_view = len(operands) == 1
 
     # unary sum
-    for idx, sub in enumerate(input_subscripts):
-        other_subscripts = copy.copy(input_subscripts)
-        other_subscripts[idx] = output_subscript
-        other_subscripts = set(itertools.chain.from_iterable(other_subscripts))
-        sum_axes = tuple(
-            axis
-            for axis, label in enumerate(sub)
-            if label not in other_subscripts
-        )
+    # After taking diagonals, each label appears at most once in each
+    # subscript, so a label can be summed out of an operand iff it appears
+    # nowhere else.
+    label_counts = collections.Counter(
+        itertools.chain(output_subscript, *input_subscripts))
+    for idx, (sub, arr) in enumerate(zip(input_subscripts, operands)):
+        sum_axes = []
+        kept_sub = []
+        kept_shape = []
+        for axis, label in enumerate(sub):
+            if label_counts[label] == 1:
+                sum_axes.append(axis)
+            else:
+                kept_sub.append(label)
+                kept_shape.append(arr.shape[axis])
         if sum_axes:
             returns_view = False
-            input_subscripts[idx] = [
-                label
-                for axis, label in enumerate(sub)
-                if axis not in sum_axes
-            ]
-
-            operands[idx] = operands[idx].sum(
-                axis=sum_axes, dtype=result_dtype)
+            sum_axes = tuple(sum_axes)
+            sub = kept_sub
+
+            if len(operands) == 1 and sub != output_subscript:
+                # Let the reduction kernel write its result directly in the
+                # order of the output subscript instead of returning a
+                # transposed view of it.
+                out = cupy.empty(
+                    [kept_shape[sub.index(label)]
+                     for label in output_subscript],
+                    dtype=result_dtype)
+                if _use_cutensor_reduction(arr, result_dtype):
+                    # cuTENSOR sums and permutes the modes in one call
+                    cutensor.reduction(
+                        1, arr, cutensor.create_tensor_descriptor(arr),
+                        _create_cutensor_mode(input_subscripts[idx]),
+                        0, out, cutensor.create_tensor_descriptor(out),
+                        _create_cutensor_mode(output_subscript))
+                else:
+                    arr.sum(
+                        axis=sum_axes, dtype=result_dtype,
+                        out=out.transpose(
+                            [output_subscript.index(label) for label in sub]))
+                input_subscripts[idx] = list(output_subscript)
+                operands[idx] = out
+            else:
+                input_subscripts[idx] = sub
+                operands[idx] = arr.sum(axis=sum_axes, dtype=result_dtype)
+        del arr
 
     if returns_view:
         operands = [a.view() for a in operands]
-    else:
+    elif len(operands) == 1:
         operands = [
             a.astype(result_dtype, copy=False, **casting_kwargs)
             for a in operands
         ]
+    # Otherwise operands are casted to result_dtype pair by pair in
+    # reduced_binary_einsum, only where it is needed.
 
-    # no more casts
-
-    optimize_algorithms = {
-        'greedy': _greedy_path,
-        'optimal': _optimal_path,
-    }
     if optimize is False:
-        path = [tuple(range(len(operands)))]
+        path = _connected_path(input_subscripts)
     elif len(optimize) and (optimize[0] == 'einsum_path'):
         path = optimize[1:]
     else:
         try:
             if len(optimize) == 2 and isinstance(optimize[1], (int, float)):
-                algo = optimize_algorithms[optimize[0]]
+                algo = _get_path_algorithm(optimize[0])
                 memory_limit = int(optimize[1])
             else:
-                algo = optimize_algorithms[optimize]
+                algo = _get_path_algorithm(optimize)
                 memory_limit = 2 ** 31  # TODO(kataoka): fix?
         except (TypeError, KeyError):  # unhashable type or not found
             raise TypeError('Did not understand the path (optimize): %s'
                             % str(optimize))
-        input_sets = [set(sub) for sub in input_subscripts]
-        output_set = set(output_subscript)
-        path = algo(input_sets, output_set, dimension_dict, memory_limit)
+        path = _compute_path(
+            algo, memory_limit,
+            tuple([tuple(sub) for sub in input_subscripts]),
+            tuple(output_subscript),
+            tuple(dimension_dict.items()))
         if any(len(indices) > 2 for indices in path):
             warnings.warn(
                 'memory efficient einsum is not supported yet',
                 _util.PerformanceWarning)
 
+    # Pairs are contracted on the current stream one after another, even if
+    # some of them are independent. Running them on side streams would let
+    # the memory pool hand the buffers of consumed intermediates back to
+    # those streams while the current stream may still be reading them.
     for idx0, idx1 in _iter_path_pairs(path):
         # "reduced" binary einsum
         arr0 = operands.pop(idx0)
@@ -674,7 +952,7 @@ def einsum(*operands, **kwargs):
             output_subscript,
             itertools.chain.from_iterable(input_subscripts)))
         arr_out, sub_out = reduced_binary_einsum(
-            arr0, sub0, arr1, sub1, sub_others)
+            arr0, sub0, arr1, sub1, sub_others, result_dtype)
         operands.append(arr_out)
         input_subscripts.append(sub_out)
         del arr0, arr1
@@ -688,9 +966,11 @@ def einsum(*operands, **kwargs):
         if label in sub0:
             transpose_axes.append(sub0.index(label))
 
-    arr_out = arr0.transpose(transpose_axes).reshape([
-        dimension_dict[label]
-        for label in output_subscript
-    ])
+    arr_out = arr0
+    if transpose_axes != list(range(arr_out.ndim)):
+        arr_out = arr_out.transpose(transpose_axes)
+    out_shape = tuple([dimension_dict[label] for label in output_subscript])
+    if arr_out.shape != out_shape:
+        arr_out = arr_out.reshape(out_shape)
     assert returns_view or arr_out.dtype == result_dtype
     return arr_out
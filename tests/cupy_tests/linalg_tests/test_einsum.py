@@ -1,3 +1,4 @@
+import itertools
 import warnings
 
 import numpy
@@ -422,6 +423,8 @@ class TestEinSumUnaryOperationWithScalar:
      'subscripts': '...k,kj'},
     {'shape_a': (4, 3), 'shape_b': (3, 2),
      'subscripts': 'ik,k...->i...'},
+    {'shape_a': (4, 3), 'shape_b': (3, 2),
+     'subscripts': 'ik,k...'},
     {'shape_a': (2, 3, 4, 5), 'shape_b': (4,),
      'subscripts': 'ijkl,k'},
     {'shape_a': (2, 3, 4, 5), 'shape_b': (4,),
@@ -442,6 +445,13 @@ class TestEinSumBinaryOperation:
         b = testing.shaped_arange(self.shape_b, xp, dtype_b)
         return xp.einsum(self.subscripts, a, b)
 
+    @testing.for_all_dtypes()
+    @testing.numpy_cupy_allclose(contiguous_check=False)
+    def test_einsum_binary_transposed(self, xp, dtype):
+        a = testing.shaped_arange(self.shape_a[::-1], xp, dtype).T
+        b = testing.shaped_arange(self.shape_b[::-1], xp, dtype).T
+        return xp.einsum(self.subscripts, a, b)
+
 
 class TestEinSumBinaryOperationWithScalar:
     @testing.for_all_dtypes()
@@ -462,6 +472,8 @@ class TestEinSumBinaryOperationWithScalar:
 @testing.parameterize(*augment_einsum_testcases(
     {'shape_a': (2, 3), 'shape_b': (3, 4), 'shape_c': (4, 5),
      'subscripts': 'ij,jk,kl'},
+    {'shape_a': (3, 4), 'shape_b': (2, 3), 'shape_c': (4, 5),
+     'subscripts': 'jk,ij,kl->il'},
     {'shape_a': (2, 4), 'shape_b': (2, 3), 'shape_c': (2,),
      'subscripts': 'ij,ik,i->ijk'},
     {'shape_a': (2, 4), 'shape_b': (3, 2), 'shape_c': (2,),
@@ -558,3 +570,97 @@ class TestEinSumLarge:
             else:
                 assert len(ws) == 0
         return out
+
+
+@testing.with_requires('opt_einsum')
+@testing.parameterize(*testing.product({
+    'subscript': [
+        'nlp,nlq->l',
+        'acdf,jbje,gihb,hfac',
+        'chd,bde,agbc,hiad,bdi,cgh,agdb',
+    ],
+    'opt': ['dp', 'branch-2', 'auto'],
+}))
+class TestEinSumOptEinsumPath:
+
+    chars = 'abcdefghijlnpq'
+    sizes = (2, 3, 4, 5, 4, 3, 2, 6, 5, 4, 3, 2, 3, 4)
+    size_dict = dict(zip(chars, sizes))
+
+    @testing.numpy_cupy_allclose(contiguous_check=False)
+    def test_einsum(self, xp):
+        terms = self.subscript.split('->')[0].split(',')
+        arrays = [
+            testing.shaped_random(
+                tuple([self.size_dict[x] for x in term]), xp, float, scale=1)
+            for term in terms
+        ]
+        if xp is numpy:
+            # NumPy does not support path finders of opt_einsum
+            return xp.einsum(self.subscript, *arrays)
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', cupy._util.PerformanceWarning)
+            return xp.einsum(self.subscript, *arrays, optimize=self.opt)
+
+
+@testing.gpu
+@pytest.mark.skipif(
+    not cupy.cuda.cutensor.available,
+    reason='The cuTENSOR routine is not enabled')
+class TestEinSumCuTensor:
+
+    @pytest.fixture(autouse=True)
+    def setUp(self):
+        old_accelerators = cupy._core.get_routine_accelerators()
+        cupy._core.set_routine_accelerators(['cutensor'])
+        yield
+        cupy._core.set_routine_accelerators(old_accelerators)
+
+    @testing.for_dtypes('fdFD')
+    @testing.numpy_cupy_allclose(rtol=1e-5, contiguous_check=False)
+    def test_einsum_unary_sum_permuted(self, xp, dtype):
+        a = testing.shaped_random((3, 4, 5), xp, dtype)
+        if xp is numpy:
+            return xp.einsum('ijk->ki', a)
+        # the sum and the permutation are done by one cuTENSOR reduction
+        with testing.AssertFunctionIsCalled(
+                'cupy.cutensor.reduction', wraps=cupy.cutensor.reduction):
+            return xp.einsum('ijk->ki', a)
+
+    @testing.for_dtypes('ilf')
+    @testing.numpy_cupy_allclose(rtol=1e-5, contiguous_check=False)
+    def test_einsum_unary_sum_permuted_fallback(self, xp, dtype):
+        # int inputs and a result dtype other than the input's are not
+        # handled by cuTENSOR
+        a = testing.shaped_random((3, 4, 5), xp, dtype)
+        if xp is numpy:
+            return xp.einsum('ijk->ki', a, dtype=numpy.float64)
+        with testing.AssertFunctionIsCalled(
+                'cupy.cutensor.reduction', times_called=0):
+            return xp.einsum('ijk->ki', a, dtype=numpy.float64)
+
+    def test_einsum_many_subscripts(self):
+        # The cuTENSOR descriptors are cached by the address of the mode
+        # buffers, so the modes of earlier subscripts must stay alive (and
+        # their addresses unused by other modes) after many other calls.
+        subscripts = []
+        for shared in itertools.permutations('abcdef', 3):
+            for new_axes in itertools.combinations(range(6), 3):
+                sub1 = list(shared)
+                for axis, label in zip(new_axes, 'ghi'):
+                    sub1.insert(axis, label)
+                subscripts.append('abcdef,' + ''.join(sub1))
+                if len(subscripts) > 520:
+                    break
+            if len(subscripts) > 520:
+                break
+
+        a = testing.shaped_random((2,) * 6, cupy, numpy.float32)
+        b = testing.shaped_random((2,) * 6, cupy, numpy.float32)
+        expected = numpy.einsum(subscripts[0], a.get(), b.get())
+        testing.assert_allclose(
+            cupy.einsum(subscripts[0], a, b), expected, rtol=1e-5)
+        for subscript in subscripts[1:]:
+            cupy.einsum(subscript, a, b)
+        testing.assert_allclose(
+            cupy.einsum(subscripts[0], a, b), expected, rtol=1e-5)
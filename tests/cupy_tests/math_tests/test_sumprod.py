@@ -7,6 +7,7 @@ import cupy
 import cupy._core._accelerator as _acc
 import cupy.cuda.cutensor
 from cupy._core import _cub_reduction
+from cupy.cuda import cub
 from cupy import testing
 
 
@@ -14,11 +15,13 @@ from cupy import testing
 class TestSumprod:
 
     @pytest.fixture(autouse=True)
-    def tearDown(self):
+    def tearDown(self, request):
         yield
-        # Free huge memory for slow test
-        cupy.get_default_memory_pool().free_all_blocks()
-        cupy.get_default_pinned_memory_pool().free_all_blocks()
+        if request.node.get_closest_marker('slow') is not None:
+            # Free huge memory for slow test; keep the blocks cached in the
+            # pool otherwise so that later tests do not hit cudaMalloc
+            cupy.get_default_memory_pool().free_all_blocks()
+            cupy.get_default_pinned_memory_pool().free_all_blocks()
 
     @testing.for_all_dtypes()
     @testing.numpy_cupy_allclose()
@@ -44,6 +47,24 @@ class TestSumprod:
         a = testing.shaped_arange((20, 30, 40), xp, dtype)
         return a.sum()
 
+    # float16 is omitted, since the sum overflows.
+    @testing.for_all_dtypes(no_float16=True)
+    @testing.numpy_cupy_allclose(rtol=1e-5)
+    def test_sum_all_two_pass(self, xp, dtype):
+        # A size not divisible by the number of partial results
+        a = testing.shaped_random((1025, 1031), xp, dtype)
+        if xp is numpy:
+            return a.sum()
+        old_routine_accelerators = _acc.get_routine_accelerators()
+        old_reduction_accelerators = _acc.get_reduction_accelerators()
+        _acc.set_routine_accelerators([])
+        _acc.set_reduction_accelerators([])
+        try:
+            return a.sum()
+        finally:
+            _acc.set_routine_accelerators(old_routine_accelerators)
+            _acc.set_reduction_accelerators(old_reduction_accelerators)
+
     @testing.for_all_dtypes()
     @testing.numpy_cupy_allclose()
     def test_sum_all_transposed(self, xp, dtype):
@@ -104,6 +125,21 @@ class TestSumprod:
         a = testing.shaped_arange((20, 30, 40), xp, dtype).transpose(2, 0, 1)
         return a.sum(axis=1)
 
+    @testing.for_all_dtypes()
+    @testing.numpy_cupy_allclose()
+    def test_sum_axis_transposed_keepdims(self, xp, dtype):
+        a = testing.shaped_arange((20, 30, 40), xp, dtype).transpose(2, 0, 1)
+        return a.sum(axis=1, keepdims=True)
+
+    @testing.for_all_dtypes()
+    @testing.numpy_cupy_allclose()
+    def test_sum_axis_transposed_out(self, xp, dtype):
+        a = testing.shaped_arange((2, 3, 4, 5), xp, dtype)
+        a = a.transpose(3, 1, 0, 2)
+        b = xp.empty((5, 2, 4), dtype=dtype)
+        a.sum(axis=1, out=b)
+        return b
+
     @testing.for_all_dtypes()
     @testing.numpy_cupy_allclose()
     def test_sum_axes(self, xp, dtype):
@@ -238,25 +274,21 @@ class TestCubReduction:
     @testing.for_dtypes('qQfdFD')
     @testing.numpy_cupy_allclose(rtol=1E-5)
     def test_cub_sum(self, xp, dtype, axis):
-        a = testing.shaped_random(self.shape, xp, dtype)
-        if self.order in ('c', 'C'):
-            a = xp.ascontiguousarray(a)
-        elif self.order in ('f', 'F'):
-            a = xp.asfortranarray(a)
+        a = testing.shaped_random(self.shape, xp, dtype, order=self.order)
 
         if xp is numpy:
             return a.sum(axis=axis)
 
-        # xp is cupy, first ensure we really use CUB
-        ret = cupy.empty(())  # Cython checks return type, need to fool it
+        # xp is cupy, ensure we really use CUB while computing the result
         if self.backend == 'device':
             func_name = 'cupy._core._routines_math.cub.'
             if len(axis) == len(self.shape):
                 func_name += 'device_reduce'
+                func = cub.device_reduce
             else:
                 func_name += 'device_segmented_reduce'
-            with testing.AssertFunctionIsCalled(func_name, return_value=ret):
-                a.sum(axis=axis)
+                func = cub.device_segmented_reduce
+            times_called = 1
         elif self.backend == 'block':
             # this is the only function we can mock; the rest is cdef'd
             func_name = 'cupy._core._cub_reduction.'
@@ -266,47 +298,80 @@ class TestCubReduction:
                 times_called = 2  # two passes
             else:
                 times_called = 1  # one pass
-            with testing.AssertFunctionIsCalled(
-                    func_name, wraps=func, times_called=times_called):
-                a.sum(axis=axis)
-        # ...then perform the actual computation
-        return a.sum(axis=axis)
+        with testing.AssertFunctionIsCalled(
+                func_name, wraps=func, times_called=times_called):
+            return a.sum(axis=axis)
+
+    @testing.for_contiguous_axes()
+    # sum supports less dtypes; don't test float16 as it's not as accurate?
+    @testing.for_dtypes('qQfdFD')
+    @testing.numpy_cupy_allclose(rtol=1E-5)
+    def test_cub_sum_out(self, xp, dtype, axis):
+        a = testing.shaped_random(self.shape, xp, dtype, order=self.order)
+        out_shape = tuple(
+            [s for i, s in enumerate(self.shape) if i not in axis])
+        out = xp.empty(out_shape, dtype, order=self.order)
+        a.sum(axis=axis, out=out)
+        return out
 
     # sum supports less dtypes; don't test float16 as it's not as accurate?
     @testing.for_dtypes('qQfdFD')
     @testing.numpy_cupy_allclose(rtol=1E-5, contiguous_check=False)
     def test_cub_sum_empty_axis(self, xp, dtype):
-        a = testing.shaped_random(self.shape, xp, dtype)
-        if self.order in ('c', 'C'):
-            a = xp.ascontiguousarray(a)
-        elif self.order in ('f', 'F'):
-            a = xp.asfortranarray(a)
+        a = testing.shaped_random(self.shape, xp, dtype, order=self.order)
         return a.sum(axis=())
 
+    # sum supports less dtypes; don't test float16 as it's not as accurate?
+    @testing.for_dtypes('qQfdFD')
+    @testing.numpy_cupy_allclose(rtol=1E-5)
+    def test_cub_sum_size1_dims(self, xp, dtype):
+        shape = (1,) + self.shape + (1,)
+        a = testing.shaped_random(shape, xp, dtype, order=self.order)
+        axis = tuple(range(1, len(shape)))
+
+        if xp is cupy and self.backend == 'device':
+            # the size-1 dims are dropped, so this is a full reduction
+            func_name = 'cupy._core._routines_math.cub.device_reduce'
+            with testing.AssertFunctionIsCalled(
+                    func_name, wraps=cub.device_reduce):
+                return a.sum(axis=axis, keepdims=True)
+        return a.sum(axis=axis, keepdims=True)
+
+    # sum supports less dtypes; don't test float16 as it's not as accurate?
+    @testing.for_dtypes('qQfdFD')
+    @testing.numpy_cupy_allclose(rtol=1E-5)
+    def test_cub_sum_all_transposed(self, xp, dtype):
+        a = testing.shaped_random(self.shape, xp, dtype)
+        a = a.transpose(*range(1, a.ndim), 0)
+
+        if xp is cupy and self.backend == 'device':
+            # the transposed view is reduced without a copy
+            func_name = 'cupy._core._routines_math.cub.device_reduce'
+            with testing.AssertFunctionIsCalled(
+                    func_name, wraps=cub.device_reduce):
+                return a.sum()
+        return a.sum()
+
     @testing.for_contiguous_axes()
     # prod supports less dtypes; don't test float16 as it's not as accurate?
     @testing.for_dtypes('qQfdFD')
     @testing.numpy_cupy_allclose(rtol=1E-5)
     def test_cub_prod(self, xp, dtype, axis):
-        a = testing.shaped_random(self.shape, xp, dtype)
-        if self.order in ('c', 'C'):
-            a = xp.ascontiguousarray(a)
-        elif self.order in ('f', 'F'):
-            a = xp.asfortranarray(a)
+        a = testing.shaped_random(self.shape, xp, dtype, order=self.order)
 
         if xp is numpy:
             return a.prod(axis=axis)
 
-        # xp is cupy, first ensure we really use CUB
-        ret = cupy.empty(())  # Cython checks return type, need to fool it
+        # xp is cupy, ensure we really use CUB while computing the result
         if self.backend == 'device':
             func_name = 'cupy._core._routines_math.cub.'
             if len(axis) == len(self.shape):
                 func_name += 'device_reduce'
+                func = cub.device_reduce
             else:
                 func_name += 'device_segmented_reduce'
-            with testing.AssertFunctionIsCalled(func_name, return_value=ret):
-                a.prod(axis=axis)
+                func = cub.device_segmented_reduce
+            times_called = 1
         elif self.backend == 'block':
             # this is the only function we can mock; the rest is cdef'd
             func_name = 'cupy._core._cub_reduction.'
@@ -316,11 +381,9 @@ class TestCubReduction:
                 times_called = 2  # two passes
             else:
                 times_called = 1  # one pass
-            with testing.AssertFunctionIsCalled(
-                    func_name, wraps=func, times_called=times_called):
-                a.prod(axis=axis)
-        # ...then perform the actual computation
-        return a.prod(axis=axis)
+        with testing.AssertFunctionIsCalled(
+                func_name, wraps=func, times_called=times_called):
+            return a.prod(axis=axis)
 
     # TODO(leofang): test axis after support is added
     # don't test float16 as it's not as accurate?
@@ -330,22 +393,34 @@ class TestCubReduction:
         if self.backend == 'block':
             pytest.skip('does not support')
 
-        a = testing.shaped_random(self.shape, xp, dtype)
-        if self.order in ('c', 'C'):
-            a = xp.ascontiguousarray(a)
-        elif self.order in ('f', 'F'):
-            a = xp.asfortranarray(a)
+        a = testing.shaped_random(self.shape, xp, dtype, order=self.order)
 
         if xp is numpy:
             return a.cumsum()
 
-        # xp is cupy, first ensure we really use CUB
-        ret = cupy.empty(())  # Cython checks return type, need to fool it
-        func = 'cupy._core._routines_math.cub.device_scan'
-        with testing.AssertFunctionIsCalled(func, return_value=ret):
-            a.cumsum()
-        # ...then perform the actual computation
-        return a.cumsum()
+        # xp is cupy, ensure we really use CUB while computing the result
+        func_name = 'cupy._core._routines_math.cub.device_scan'
+        with testing.AssertFunctionIsCalled(func_name, wraps=cub.device_scan):
+            return a.cumsum()
+
+    # don't test float16 as it's not as accurate?
+    @testing.for_dtypes('bhilBHILfdF')
+    @testing.numpy_cupy_allclose(rtol=1E-4)
+    def test_cub_cumsum_1dim_axis(self, xp, dtype):
+        if self.backend == 'block':
+            pytest.skip('does not support')
+        if len(self.shape) != 1:
+            pytest.skip('only the scan of 1-D arrays along an axis uses CUB')
+
+        a = testing.shaped_random(self.shape, xp, dtype)
+
+        if xp is numpy:
+            return a.cumsum(axis=0)
+
+        # xp is cupy, ensure we really use CUB while computing the result
+        func_name = 'cupy._core._routines_math.cub.device_scan'
+        with testing.AssertFunctionIsCalled(func_name, wraps=cub.device_scan):
+            return a.cumsum(axis=0)
 
     # TODO(leofang): test axis after support is added
     # don't test float16 as it's not as accurate?
@@ -355,23 +430,16 @@ class TestCubReduction:
         if self.backend == 'block':
             pytest.skip('does not support')
 
-        a = testing.shaped_random(self.shape, xp, dtype)
-        if self.order in ('c', 'C'):
-            a = xp.ascontiguousarray(a)
-        elif self.order in ('f', 'F'):
-            a = xp.asfortranarray(a)
+        a = testing.shaped_random(self.shape, xp, dtype, order=self.order)
 
         if xp is numpy:
             result = a.cumprod()
             return self._mitigate_cumprod(xp, dtype, result)
 
-        # xp is cupy, first ensure we really use CUB
-        ret = cupy.empty(())  # Cython checks return type, need to fool it
-        func = 'cupy._core._routines_math.cub.device_scan'
-        with testing.AssertFunctionIsCalled(func, return_value=ret):
-            a.cumprod()
-        # ...then perform the actual computation
-        result = a.cumprod()
+        # xp is cupy, ensure we really use CUB while computing the result
+        func_name = 'cupy._core._routines_math.cub.device_scan'
+        with testing.AssertFunctionIsCalled(func_name, wraps=cub.device_scan):
+            result = a.cumprod()
         return self._mitigate_cumprod(xp, dtype, result)
 
     def _mitigate_cumprod(self, xp, dtype, result):
@@ -410,11 +478,7 @@ class TestCuTensorReduction:
     @testing.for_dtypes('qQfdFD')
     @testing.numpy_cupy_allclose(rtol=1E-5, contiguous_check=False)
     def test_cutensor_sum(self, xp, dtype, axis):
-        a = testing.shaped_random(self.shape, xp, dtype)
-        if self.order in ('c', 'C'):
-            a = xp.ascontiguousarray(a)
-        elif self.order in ('f', 'F'):
-            a = xp.asfortranarray(a)
+        a = testing.shaped_random(self.shape, xp, dtype, order=self.order)
 
         if xp is numpy:
             return a.sum(axis=axis)
@@ -431,11 +495,7 @@ class TestCuTensorReduction:
     @testing.for_dtypes('qQfdFD')
     @testing.numpy_cupy_allclose(rtol=1E-5, contiguous_check=False)
     def test_cutensor_sum_empty_axis(self, xp, dtype):
-        a = testing.shaped_random(self.shape, xp, dtype)
-        if self.order in ('c', 'C'):
-            a = xp.ascontiguousarray(a)
-        elif self.order in ('f', 'F'):
-            a = xp.asfortranarray(a)
+        a = testing.shaped_random(self.shape, xp, dtype, order=self.order)
         return a.sum(axis=())
 
 
@@ -895,6 +955,20 @@ class TestDiff:
         a = testing.shaped_arange((4, 5), xp, dtype)
         return xp.diff(a, prepend=1, append=0)
 
+    @testing.for_all_dtypes()
+    @testing.numpy_cupy_allclose()
+    def test_diff_3dim_with_n_prepend_and_append(self, xp, dtype):
+        a = testing.shaped_arange((2, 5, 3), xp, dtype).transpose(1, 0, 2)
+        b = testing.shaped_arange((2, 2, 3), xp, dtype)
+        c = testing.shaped_reverse_arange((1, 2, 3), xp, dtype)
+        return xp.diff(a, n=3, axis=0, prepend=b, append=c)
+
+    @testing.for_all_dtypes(no_bool=True, no_float16=True)
+    @testing.numpy_cupy_allclose()
+    def test_diff_1dim_with_large_n(self, xp, dtype):
+        a = testing.shaped_arange((25,), xp, dtype) % 3
+        return xp.diff(a, n=20)
+
     @testing.with_requires('numpy>=1.16')
     def test_diff_invalid_axis(self):
         for xp in (numpy, cupy):
@@ -904,6 +978,12 @@ class TestDiff:
             with pytest.raises(numpy.AxisError):
                 xp.diff(a, axis=-4)
 
+    def test_diff_non_integer_n(self):
+        for xp in (numpy, cupy):
+            a = testing.shaped_arange((2, 3, 4), xp)
+            with pytest.raises(TypeError):
+                xp.diff(a, n=2.0)
+
 
 # This class compares CUB results against NumPy's
 @testing.parameterize(*testing.product_dict(